@@ -1,3 +1,5 @@
+from typing import Callable
+
 from app.ai.config import load_ai_config
 from app.ai.types import AIClient
 
@@ -6,16 +8,27 @@ from app.ai.providers.claude_provider import ClaudeProvider
 from app.ai.providers.gemini_provider import GeminiProvider
 
 
+_PROVIDERS: dict[str, Callable[..., AIClient]] = {
+    "openai": OpenAIProvider,
+    "claude": ClaudeProvider,
+    "gemini": GeminiProvider,
+}
+_client_cache: dict[tuple[str, str], AIClient] = {}
+
+
 def get_ai_client() -> AIClient:
     cfg = load_ai_config()
+    key = (cfg.provider, cfg.model)
 
-    if cfg.provider == "openai":
-        return OpenAIProvider(model=cfg.model)
-
-    if cfg.provider == "claude":
-        return ClaudeProvider(model=cfg.model)
+    # Reuse clients so the SDK's HTTP connection pool survives across requests.
+    client = _client_cache.get(key)
+    if client is not None:
+        return client
 
-    if cfg.provider == "gemini":
-        return GeminiProvider(model=cfg.model)
+    provider_cls = _PROVIDERS.get(cfg.provider)
+    if provider_cls is None:
+        raise ValueError(f"Unsupported AI_PROVIDER='{cfg.provider}'")
 
-    raise ValueError(f"Unsupported AI_PROVIDER='{cfg.provider}'")
+    client = provider_cls(model=cfg.model)
+    _client_cache[key] = client
+    return client
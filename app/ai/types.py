@@ -5,7 +5,7 @@ from typing import AsyncGenerator, Literal, Protocol, Sequence
 Role = Literal["system", "user", "assistant"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatMessage:
     role: Role
     content: str
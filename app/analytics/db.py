@@ -153,8 +153,9 @@ def purge_old_records() -> dict[str, int]:
     return deleted
 
 
-def _row_to_dict(cursor: sqlite3.Cursor, row: tuple) -> dict[str, Any]:
-    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+def _rows_to_dicts(cursor: sqlite3.Cursor, rows: list[tuple]) -> list[dict[str, Any]]:
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in rows]
 
 
 def get_summary() -> dict[str, Any]:
@@ -196,8 +197,7 @@ def get_latest(limit: int = 20) -> list[dict[str, Any]]:
             """,
             (limit,),
         )
-        rows = cur.fetchall()
-        return [_row_to_dict(cur, row) for row in rows]
+        return _rows_to_dicts(cur, cur.fetchall())
 
 
 def get_top_questions(limit: int = 10) -> list[dict[str, Any]]:
@@ -216,8 +216,7 @@ def get_top_questions(limit: int = 10) -> list[dict[str, Any]]:
             """,
             (limit,),
         )
-        rows = cur.fetchall()
-        return [_row_to_dict(cur, row) for row in rows]
+        return _rows_to_dicts(cur, cur.fetchall())
 
 
 def get_feedback(limit: int = 20) -> list[dict[str, Any]]:
@@ -234,5 +233,4 @@ def get_feedback(limit: int = 20) -> list[dict[str, Any]]:
             """,
             (limit,),
         )
-        rows = cur.fetchall()
-        return [_row_to_dict(cur, row) for row in rows]
+        return _rows_to_dicts(cur, cur.fetchall())
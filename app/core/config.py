@@ -97,7 +97,7 @@ settings = Settings(
             "https://codedbyasad.com",
         ],
     ),
-    cors_allow_origin_regex=_get_env("CORS_ALLOW_ORIGIN_REGEX", r"^https:\/\/[a-z0-9-]+-.*\.vercel\.app$"),
+    cors_allow_origin_regex=_get_env("CORS_ALLOW_ORIGIN_REGEX", r"^https://[a-z0-9-][a-z0-9]*-.*\.vercel\.app$"),
     cors_allow_credentials=_get_env_bool("CORS_ALLOW_CREDENTIALS", False),
     trust_x_forwarded_for=_get_env_bool("TRUST_X_FORWARDED_FOR", False),
     mmr_use=_get_env_bool("MMR_USE", True),
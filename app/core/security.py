@@ -5,6 +5,15 @@ from fastapi import HTTPException, status
 from app.core.config import settings
 
 
+_AUTH_ERROR_MESSAGES = {
+    "en": "Please provide a valid API key to use the chatbot.",
+    "de": "Bitte gib einen gültigen API‑Schlüssel an, um den Chatbot zu nutzen.",
+    "fr": "Veuillez fournir une clé API valide pour utiliser le chatbot.",
+    "es": "Por favor, proporciona una clave API válida para usar el chatbot.",
+    "it": "Per favore, fornisci una chiave API valida per usare il chatbot.",
+}
+
+
 def _normalize_lang(lang: str | None) -> str:
     if not lang:
         return "en"
@@ -13,14 +22,7 @@ def _normalize_lang(lang: str | None) -> str:
 
 def _auth_error_message(lang: str | None) -> str:
     key = _normalize_lang(lang)
-    messages = {
-        "en": "Please provide a valid API key to use the chatbot.",
-        "de": "Bitte gib einen gültigen API‑Schlüssel an, um den Chatbot zu nutzen.",
-        "fr": "Veuillez fournir une clé API valide pour utiliser le chatbot.",
-        "es": "Por favor, proporciona una clave API válida para usar el chatbot.",
-        "it": "Per favore, fornisci una chiave API valida per usare il chatbot.",
-    }
-    return messages.get(key, messages["en"])
+    return _AUTH_ERROR_MESSAGES.get(key, _AUTH_ERROR_MESSAGES["en"])
 
 
 def check_api_key(x_api_key: str | None, lang: str | None = None) -> None:
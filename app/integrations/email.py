@@ -23,8 +23,9 @@ def _smtp_password() -> str | None:
 
 
 def _smtp_login_if_needed(server: smtplib.SMTP) -> None:
-    if settings.smtp_user and _smtp_password():
-        server.login(settings.smtp_user, _smtp_password())
+    password = _smtp_password()
+    if settings.smtp_user and password:
+        server.login(settings.smtp_user, password)
 
 
 def _send_via_smtp_with(host: str, port: int, use_tls: bool, msg: EmailMessage, context: ssl.SSLContext) -> None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from google.oauth2 import service_account
@@ -16,7 +17,9 @@ SCOPES = [
 ]
 
 
+@lru_cache(maxsize=1)
 def _get_credentials():
+    # Settings are frozen; one credentials object lets google-auth reuse its access token.
     if settings.google_service_account_json:
         info = json.loads(settings.google_service_account_json)
         creds = service_account.Credentials.from_service_account_info(info, scopes=SCOPES)
@@ -44,8 +47,8 @@ def _ensure_iso(dt: str) -> str:
     return dt + "Z"
 
 
-def check_busy(start: str, end: str, timezone_name: str) -> bool:
-    service = _service()
+def check_busy(start: str, end: str, timezone_name: str, *, service=None) -> bool:
+    service = service or _service()
     body = {
         "timeMin": _ensure_iso(start),
         "timeMax": _ensure_iso(end),
@@ -57,8 +60,8 @@ def check_busy(start: str, end: str, timezone_name: str) -> bool:
     return len(busy) > 0
 
 
-def create_event(payload: dict[str, Any]) -> dict[str, Any]:
-    service = _service()
+def create_event(payload: dict[str, Any], *, service=None) -> dict[str, Any]:
+    service = service or _service()
     tz = payload.get("timezone") or settings.google_calendar_timezone
 
     event = {
@@ -91,9 +94,15 @@ def create_event(payload: dict[str, Any]) -> dict[str, Any]:
 
 def create_booking(payload: dict[str, Any]) -> dict[str, Any]:
     try:
-        if check_busy(payload["start"], payload["end"], payload.get("timezone") or settings.google_calendar_timezone):
+        service = _service()
+        if check_busy(
+            payload["start"],
+            payload["end"],
+            payload.get("timezone") or settings.google_calendar_timezone,
+            service=service,
+        ):
             return {"status": "busy"}
-        event = create_event(payload)
+        event = create_event(payload, service=service)
         return {
             "status": "booked",
             "eventId": event.get("id"),
@@ -6,10 +6,11 @@ from typing import List, Dict, Tuple
 
 import numpy as np
 import faiss
-from sentence_transformers import SentenceTransformer
 
+from app.rag.retriever import FaissRetriever
 
-@dataclass
+
+@dataclass(slots=True)
 class Chunk:
     id: str
     text: str
@@ -53,7 +54,8 @@ def build_faiss_index(
     out_path = Path(out_dir)/lang
     out_path.mkdir(parents=True, exist_ok=True)
 
-    model = SentenceTransformer(model_name)
+    # Shared with the retriever so startup ingest + warmup load the model once.
+    model = FaissRetriever._get_model(model_name)
 
     md_files = _read_markdown_files(doc_dir)
     chunks: List[Chunk] = []
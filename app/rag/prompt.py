@@ -2,6 +2,38 @@ from typing import List, Dict
 from app.ai.types import ChatMessage
 
 
+_PROMPTS: dict[str, dict[str, str]] = {
+    "en": {
+        "system": (
+            "You are a portfolio assistant for Asad Khan. "
+            "Use only information from the provided context. "
+            "If an exact value is missing, provide the closest supported information and clearly state the limitation. "
+            "Say 'I don't have that in my documents.' only when the context truly has no relevant facts. "
+            "Respond as clean, user-facing Markdown for streaming. "
+            "Do NOT output JSON, XML, or wrapper tags."
+        ),
+        "history": "HISTORY",
+        "question": "QUESTION",
+        "context": "CONTEXT",
+        "answer": "ANSWER",
+    },
+    "de": {
+        "system": (
+            "Du bist ein Portfolio-Assistent fuer Asad Khan. "
+            "Nutze nur Informationen aus dem bereitgestellten Kontext. "
+            "Wenn eine exakte Angabe fehlt, gib die naechstbeste belegte Information und markiere die Unsicherheit klar. "
+            "Sag nur dann 'Das steht nicht in meinen Unterlagen.', wenn der Kontext wirklich keine relevanten Fakten enthaelt. "
+            "Antworte als klares, nutzerfreundliches Markdown fuer Streaming. "
+            "Gib KEIN JSON, KEIN XML und KEINE Tags aus."
+        ),
+        "history": "VERLAUF",
+        "question": "FRAGE",
+        "context": "KONTEXT",
+        "answer": "ANTWORT",
+    },
+}
+
+
 def build_context(chunks, max_chars_per_chunk=900):
     lines = []
     for i, c in enumerate(chunks, start=1):
@@ -35,44 +67,16 @@ def build_rag_messages(
             history_lines.append(f"{label}: {content}")
     history_text = "\n".join(history_lines).strip()
 
-    if lang == "de":
-        system = (
-            "Du bist ein Portfolio-Assistent fuer Asad Khan. "
-            "Nutze nur Informationen aus dem bereitgestellten Kontext. "
-            "Wenn eine exakte Angabe fehlt, gib die naechstbeste belegte Information und markiere die Unsicherheit klar. "
-            "Sag nur dann 'Das steht nicht in meinen Unterlagen.', wenn der Kontext wirklich keine relevanten Fakten enthaelt. "
-            "Antworte als klares, nutzerfreundliches Markdown fuer Streaming. "
-            "Gib KEIN JSON, KEIN XML und KEINE Tags aus."
-        )
-        if history_text:
-            user = (
-                f"VERLAUF:\n{history_text}\n\n"
-                f"FRAGE:\n{user_question}\n\n"
-                f"KONTEXT:\n{context}\n\n"
-                "ANTWORT:"
-            )
-        else:
-            user = f"FRAGE:\n{user_question}\n\nKONTEXT:\n{context}\n\nANTWORT:"
-    else:
-        system = (
-            "You are a portfolio assistant for Asad Khan. "
-            "Use only information from the provided context. "
-            "If an exact value is missing, provide the closest supported information and clearly state the limitation. "
-            "Say 'I don't have that in my documents.' only when the context truly has no relevant facts. "
-            "Respond as clean, user-facing Markdown for streaming. "
-            "Do NOT output JSON, XML, or wrapper tags."
-        )
-        if history_text:
-            user = (
-                f"HISTORY:\n{history_text}\n\n"
-                f"QUESTION:\n{user_question}\n\n"
-                f"CONTEXT:\n{context}\n\n"
-                "ANSWER:"
-            )
-        else:
-            user = f"QUESTION:\n{user_question}\n\nCONTEXT:\n{context}\n\nANSWER:"
+    prompt = _PROMPTS.get(lang, _PROMPTS["en"])
+    user = (
+        f"{prompt['question']}:\n{user_question}\n\n"
+        f"{prompt['context']}:\n{context}\n\n"
+        f"{prompt['answer']}:"
+    )
+    if history_text:
+        user = f"{prompt['history']}:\n{history_text}\n\n{user}"
 
     return [
-        ChatMessage(role="system", content=system),
+        ChatMessage(role="system", content=prompt["system"]),
         ChatMessage(role="user", content=user),
     ]
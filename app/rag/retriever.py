@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,7 +11,7 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Chunk:
     id: str
     source: str
@@ -73,30 +74,27 @@ class FaissRetriever:
         k = min(k, n)
         query_vec = query_emb.reshape(-1)
         sim_to_query = doc_embs @ query_vec
+        # Pairwise similarities in one matmul; each step then only folds in
+        # the newly selected row instead of re-multiplying every selection.
+        doc_sims = doc_embs @ doc_embs.T
+        max_sim = np.full(n, -np.inf, dtype=doc_sims.dtype)
 
         selected: list[int] = []
-        candidate_idxs = list(range(n))
+        taken = np.zeros(n, dtype=bool)
 
-        while len(selected) < k and candidate_idxs:
-            if not selected:
-                next_idx = int(np.argmax(sim_to_query))
-                selected.append(next_idx)
-                candidate_idxs.remove(next_idx)
-                continue
-
-            selected_embs = doc_embs[selected]
-            sim_to_selected = doc_embs @ selected_embs.T
-            max_sim = sim_to_selected.max(axis=1)
-            mmr_scores = lambda_mult * sim_to_query - (1 - lambda_mult) * max_sim
-
-            for idx in selected:
-                mmr_scores[idx] = -np.inf
+        while len(selected) < k:
+            if selected:
+                mmr_scores = lambda_mult * sim_to_query - (1 - lambda_mult) * max_sim
+                mmr_scores[taken] = -np.inf
+            else:
+                mmr_scores = sim_to_query
 
             next_idx = int(np.argmax(mmr_scores))
-            if next_idx in selected:
+            if taken[next_idx]:
                 break
             selected.append(next_idx)
-            candidate_idxs.remove(next_idx)
+            taken[next_idx] = True
+            np.maximum(max_sim, doc_sims[next_idx], out=max_sim)
 
         return selected
 
@@ -113,9 +111,10 @@ class FaissRetriever:
         if not q:
             return []
 
-        emb = self._model.encode([q], normalize_embeddings=True)
-        emb = np.asarray(emb, dtype="float32")
+        emb = _encode_query(self.model_name, q)
 
+        # With no diversity weight MMR reduces to FAISS's own score order.
+        use_mmr = use_mmr and mmr_lambda < 1.0
         search_k = max(k, fetch_k) if use_mmr else k
         scores, idxs = self._index.search(emb, search_k)
         results: list[dict[str, Any]] = []
@@ -150,3 +149,12 @@ class FaissRetriever:
         selected_idxs = self._mmr_select(emb[0], doc_embs, k, mmr_lambda)
         reranked = [results[i] for i in selected_idxs]
         return reranked
+
+
+@lru_cache(maxsize=512)
+def _encode_query(model_name: str, query: str) -> np.ndarray:
+    # Visitors repeat the same starter questions, so reuse their embeddings.
+    emb = FaissRetriever._get_model(model_name).encode([query], normalize_embeddings=True)
+    emb = np.asarray(emb, dtype="float32")
+    emb.setflags(write=False)
+    return emb
@@ -1,4 +1,5 @@
 from typing import AsyncGenerator
+import asyncio
 import hashlib
 import json
 import logging
@@ -18,6 +19,18 @@ from app.analytics.db import log_chat_event
 logger = logging.getLogger("app.chat")
 _conversations: dict[str, list[dict[str, str]]] = {}
 _max_history = 6
+_max_conversations = 1000
+_low_confidence_cta = json.dumps(
+    {
+        "email": settings.contact_email,
+        "linkedin": settings.contact_linkedin,
+        "reason": "low_confidence",
+        "message": (
+            "I couldn't find this in my documents. "
+            "Please reach out via email or LinkedIn and I’ll respond quickly."
+        ),
+    }
+)
 
 
 def _short_hash(value: str | None) -> str:
@@ -47,10 +60,14 @@ def _get_history(conversation_id: str | None) -> list[dict[str, str]]:
 def _append_history(conversation_id: str | None, role: str, content: str) -> None:
     if not conversation_id:
         return
-    history = _conversations.setdefault(conversation_id, [])
+    # Re-insert so dict order tracks recency and the oldest conversation is evicted first.
+    history = _conversations.pop(conversation_id, [])
     history.append({"role": role, "content": content})
     if len(history) > _max_history * 2:
         del history[:-_max_history * 2]
+    _conversations[conversation_id] = history
+    while len(_conversations) > _max_conversations:
+        del _conversations[next(iter(_conversations))]
 
 
 async def stream_chat(
@@ -79,14 +96,16 @@ async def stream_chat(
 
         lang = (language or "").strip().lower() or detect_lang(user_message)
 
-        retriever = FaissRetriever.get(lang)
+        # Retrieval and analytics writes block; run them off the event loop.
+        retriever = await asyncio.to_thread(FaissRetriever.get, lang)
         top_k = k or 5
         resolved_use_mmr = settings.mmr_use if use_mmr is None else use_mmr
         resolved_fetch_k = (
             settings.mmr_fetch_k if fetch_k is None else fetch_k
         ) or max(10, top_k * 3)
         resolved_mmr_lambda = settings.mmr_lambda if mmr_lambda is None else mmr_lambda
-        chunks = retriever.search(
+        chunks = await asyncio.to_thread(
+            retriever.search,
             user_message,
             k=top_k,
             use_mmr=resolved_use_mmr,
@@ -106,48 +125,36 @@ async def stream_chat(
         resolved_include_citations = True if include_citations is None else include_citations
         max_score = max((c.get("score", 0.0) or 0.0) for c in chunks) if chunks else 0.0
         low_confidence = len(chunks) == 0 or max_score < settings.min_chunk_score
+        sources = [
+            {"id": c.get("id"), "source": c.get("source"), "score": c.get("score")}
+            for c in chunks
+        ]
         if resolved_include_citations:
-            sources = [
-                {"id": c.get("id"), "source": c.get("source"), "score": c.get("score")}
-                for c in chunks
-            ]
             yield sse(events.SOURCES, json.dumps(sources))
         if low_confidence:
-            yield sse(
-                events.CTA,
+            yield sse(events.CTA, _low_confidence_cta)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
                 json.dumps(
                     {
-                        "email": settings.contact_email,
-                        "linkedin": settings.contact_linkedin,
-                        "reason": "low_confidence",
-                        "message": (
-                            "I couldn't find this in my documents. "
-                            "Please reach out via email or LinkedIn and I’ll respond quickly."
-                        ),
+                        "event": "chat_request",
+                        "lang": lang,
+                        "k": top_k,
+                        "conversation_hash": _short_hash(conversation_id),
+                        "message_id_hash": _short_hash(message_id),
+                        "compress_context": compress_context,
+                        "include_citations": resolved_include_citations,
+                        "use_mmr": resolved_use_mmr,
+                        "fetch_k": resolved_fetch_k,
+                        "mmr_lambda": resolved_mmr_lambda,
+                        "max_score": max_score,
+                        "message_len": len(user_message),
+                        "message_hash": _short_hash(user_message),
+                        "chunk_ids": [c.get("id") for c in chunks],
                     }
-                ),
-            )
-
-        logger.info(
-            json.dumps(
-                {
-                    "event": "chat_request",
-                    "lang": lang,
-                    "k": top_k,
-                    "conversation_hash": _short_hash(conversation_id),
-                    "message_id_hash": _short_hash(message_id),
-                    "compress_context": compress_context,
-                    "include_citations": resolved_include_citations,
-                    "use_mmr": resolved_use_mmr,
-                    "fetch_k": resolved_fetch_k,
-                    "mmr_lambda": resolved_mmr_lambda,
-                    "max_score": max_score,
-                    "message_len": len(user_message),
-                    "message_hash": _short_hash(user_message),
-                    "chunk_ids": [c.get("id") for c in chunks],
-                }
+                )
             )
-        )
 
         _append_history(conversation_id, "user", user_message)
 
@@ -158,21 +165,20 @@ async def stream_chat(
             yield sse(events.CHUNK, token)
 
         yield sse(events.DONE, "[DONE]")
-        _append_history(conversation_id, "assistant", _strip_json_block(assistant_text))
-        log_chat_event(
+        response_text = _strip_json_block(assistant_text)
+        _append_history(conversation_id, "assistant", response_text)
+        await asyncio.to_thread(
+            log_chat_event,
             conversation_id=conversation_id,
             message_id=message_id,
             language=lang,
             question=user_message,
-            response=_strip_json_block(assistant_text),
+            response=response_text,
             k=top_k,
             use_mmr=resolved_use_mmr,
             fetch_k=resolved_fetch_k,
             mmr_lambda=resolved_mmr_lambda,
-            sources=[
-                {"id": c.get("id"), "source": c.get("source"), "score": c.get("score")}
-                for c in chunks
-            ],
+            sources=sources,
         )
 
     except Exception as ex:
@@ -188,11 +194,12 @@ async def stream_chat(
         yield sse(events.ERROR, str(ex))
         yield sse(events.DONE, "[DONE]")
     else:
-        logger.info(
-            json.dumps(
-                {
-                    "event": "chat_complete",
-                    "duration_ms": int((time.perf_counter() - started_at) * 1000),
-                }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                json.dumps(
+                    {
+                        "event": "chat_complete",
+                        "duration_ms": int((time.perf_counter() - started_at) * 1000),
+                    }
+                )
             )
-        )
@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.rag.retriever import FaissRetriever
+
+
+def _mmr(query: list[float], docs: list[list[float]], k: int, lambda_mult: float) -> list[int]:
+    doc_embs = np.asarray(docs, dtype="float32")
+    doc_embs /= np.linalg.norm(doc_embs, axis=1, keepdims=True)
+    query_emb = np.asarray(query, dtype="float32")
+    query_emb /= np.linalg.norm(query_emb)
+    # _mmr_select needs no index state, so skip loading FAISS files.
+    retriever = object.__new__(FaissRetriever)
+    return retriever._mmr_select(query_emb, doc_embs, k, lambda_mult)
+
+
+def test_mmr_skips_near_duplicates() -> None:
+    docs = [[1.0, 0.1], [1.0, 0.11], [0.6, 0.8]]
+
+    assert _mmr([1.0, 0.0], docs, k=2, lambda_mult=0.3) == [0, 2]
+
+
+def test_mmr_pure_relevance_keeps_score_order() -> None:
+    docs = [[0.6, 0.8], [1.0, 0.1], [1.0, 0.11]]
+
+    assert _mmr([1.0, 0.0], docs, k=3, lambda_mult=1.0) == [1, 2, 0]
+
+
+def test_mmr_returns_at_most_available_docs() -> None:
+    assert _mmr([1.0, 0.0], [[1.0, 0.0]], k=5, lambda_mult=0.6) == [0]
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.rag.prompt import build_rag_messages
+
+
+def test_english_prompt_without_history() -> None:
+    chunks = [{"source": "cv.md", "text": "Senior engineer."}]
+
+    system, user = build_rag_messages("Who is Asad?", chunks, "en")
+
+    assert system.role == "system"
+    assert system.content.startswith("You are a portfolio assistant for Asad Khan.")
+    assert user.content == (
+        "QUESTION:\nWho is Asad?\n\n"
+        "CONTEXT:\n[1] source: cv.md\nSenior engineer.\n\n"
+        "ANSWER:"
+    )
+
+
+def test_german_prompt_with_history() -> None:
+    history = [
+        {"role": "user", "content": "Hallo"},
+        {"role": "assistant", "content": "Hi!"},
+    ]
+
+    system, user = build_rag_messages("Wer ist Asad?", [], "de", history=history)
+
+    assert system.content.startswith("Du bist ein Portfolio-Assistent fuer Asad Khan.")
+    assert user.content == (
+        "VERLAUF:\nUser: Hallo\nAssistant: Hi!\n\n"
+        "FRAGE:\nWer ist Asad?\n\n"
+        "KONTEXT:\n\n\n"
+        "ANTWORT:"
+    )
+
+
+def test_unknown_language_falls_back_to_english() -> None:
+    system, user = build_rag_messages("Hola", [], "es")
+
+    assert system.content.startswith("You are a portfolio assistant")
+    assert user.content.startswith("QUESTION:\nHola")